@@ -1,7 +1,19 @@
 
 from .exceptions import *
 
-from .raster import BrotherQLRaster
-
-from .brother_ql_create import create_label
+def __getattr__(name):
+    """
+    Resolve the package's convenience re-exports lazily (PEP 562).
 
+    Importing brother_ql (e.g. for the CLI entry point) would otherwise
+    drag in PIL, packbits and the device tables before a single command
+    line option is parsed; deferring them keeps `brother_ql --help` and
+    simple subcommands free of that import cost.
+    """
+    if name == 'BrotherQLRaster':
+        from .raster import BrotherQLRaster
+        return BrotherQLRaster
+    if name == 'create_label':
+        from .brother_ql_create import create_label
+        return create_label
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
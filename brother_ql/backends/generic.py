@@ -1,6 +1,7 @@
 
 
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +26,52 @@ class BrotherQLBackendGeneric(object):
     def _write(self, data):
         self.write_dev.write(data)
 
-    def _read(self, length=32):
+    def _read(self, length=512):
         return bytes(self.read_dev.read(length))
 
+    def _writev(self, chunks):
+        self._write(b''.join(chunks))
+
     def write(self, data):
         logger.debug('Writing %d bytes.', len(data))
         self._write(data)
 
-    def read(self, length=32):
+    def writev(self, chunks):
+        """
+        Write a sequence of instruction chunks in as few device
+        operations as possible (a single one for most backends),
+        instead of one write call per chunk.
+        """
+        chunks = list(chunks)
+        logger.debug('Writing %d chunks, %d bytes in total.', len(chunks), sum(len(c) for c in chunks))
+        self._writev(chunks)
+
+    def wait_readable(self, timeout):
+        """
+        Block for up to `timeout` seconds until the device has data to be read.
+
+        Returns True if data is waiting, False if the timeout elapsed and
+        None if the backend cannot wait for read readiness (callers should
+        then fall back to polling with sleeps in between).
+        """
+        return None
+
+    def read(self, length=512, timeout=None):
+        """
+        Read up to `length` bytes from the device.
+
+        With `timeout` set, block up to that many seconds until data is
+        available before reading - a single kernel-level wait instead of
+        the caller polling with sleeps in between. Backends that cannot
+        wait for read readiness sleep once for the full timeout.
+        """
         try:
+            if timeout is not None:
+                ready = self.wait_readable(timeout)
+                if ready is None:
+                    time.sleep(timeout)
+                elif not ready:
+                    return b''
             ret_bytes = self._read(length)
             if ret_bytes: logger.debug('Read %d bytes.', len(ret_bytes))
             return ret_bytes
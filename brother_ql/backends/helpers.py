@@ -9,20 +9,117 @@ Helpers for the subpackage brother_ql.backends
 
 import logging, time
 
+from functools import lru_cache
+
 from brother_ql.backends import backend_factory, guess_backend
 from brother_ql.reader import interpret_response
 
 logger = logging.getLogger(__name__)
 
-def discover(backend_identifier='linux_kernel'):
+#: 'ESC i S' - the status information request opcode.
+STATUS_REQUEST_CODE = b'\x1b\x69\x53'
+
+#: The result of backend_factory() only depends on the backend name, so
+#: memoize it instead of re-importing and rebuilding the dict each call.
+_backend_factory = lru_cache(maxsize=8)(backend_factory)
+
+@lru_cache(maxsize=32)
+def _guess_backend(printer_identifier):
+    """
+    Cached wrapper around guess_backend().
+
+    Returns None instead of raising ValueError for identifiers no
+    backend can be guessed for, so the (negative) result can be cached.
+    """
+    try:
+        return guess_backend(printer_identifier)
+    except ValueError:
+        return None
+
+def _resolve_backend(backend_identifier, printer_identifier):
+    """
+    Select the backend: either the explicitly stated one or the one
+    guessed from the printer identifier, falling back to linux_kernel.
+    """
+    if backend_identifier:
+        return backend_identifier
+    selected_backend = None
+    if isinstance(printer_identifier, str):
+        # Non-string identifiers (os.open() handles, usb.core.Device
+        # instances) can't be guessed from - and shouldn't end up as
+        # lru_cache keys - so they go straight to the default.
+        selected_backend = _guess_backend(printer_identifier)
+    if selected_backend is None:
+        logger.info("No backend stated. Selecting the default linux_kernel backend.")
+        selected_backend = 'linux_kernel'
+    return selected_backend
+
+#: Status frames repeat a lot while a print is in progress; parsing the
+#: same 32 bytes again always yields the same result, so memoize it.
+_interpret_response = lru_cache(maxsize=64)(interpret_response)
+
+#: Prefixes of unparsable responses that were already reported. A printer
+#: repeating the same garbage frame shouldn't be able to flood the log
+#: (and slow down the wait loop) with errors.
+_reported_unparsable_prefixes = set()
+
+def _log_unparsable_response(frame, elapsed):
+    prefix = bytes(frame[:4])
+    if prefix in _reported_unparsable_prefixes:
+        logger.debug("TIME %.3f - Couln't understand response: %s", elapsed, frame)
+        return
+    _reported_unparsable_prefixes.add(prefix)
+    logger.error("TIME %.3f - Couln't understand response: %s", elapsed, frame)
+
+#: Cached discover() results per backend identifier: {backend: (timestamp, devices)}
+_discover_cache = {}
+#: How long (in seconds) cached discover() results stay valid.
+DISCOVER_CACHE_TTL = 2.0
+
+def discover(backend_identifier='linux_kernel', force=False):
+    """
+    List the devices available with the selected backend.
+
+    Device enumeration can be slow (it may open device files or walk the
+    USB bus), so results are cached for a short time. Set `force` to True
+    to bypass the cache, e.g. right after plugging in a printer.
+    """
+
+    cached = _discover_cache.get(backend_identifier)
+    if cached and not force and time.monotonic() - cached[0] < DISCOVER_CACHE_TTL:
+        return cached[1]
 
-    be = backend_factory(backend_identifier)
-    list_available_devices = be['list_available_devices']
-    BrotherQLBackend       = be['backend_class']
+    be = _backend_factory(backend_identifier)
 
-    available_devices = list_available_devices()
+    available_devices = be['list_available_devices']()
+    _discover_cache[backend_identifier] = (time.monotonic(), available_devices)
     return available_devices
 
+async def discover_iter(backend_identifier='linux_kernel', force=False):
+    """
+    Asynchronous variant of discover() that yields devices one by one.
+
+    The blocking enumeration is run in a worker thread via
+    asyncio.to_thread(), so an event loop driving a GUI or daemon stays
+    responsive while printers are being listed.
+    """
+    import asyncio
+    for device in await asyncio.to_thread(discover, backend_identifier, force):
+        yield device
+
+async def send_async(instructions, printer_identifier=None, backend_identifier=None, blocking=True):
+    """
+    Asynchronous variant of send().
+
+    The blocking backend I/O is run in a worker thread (which releases
+    the GIL while waiting on the device), so a fleet of printers can be
+    driven concurrently from a single event loop:
+
+        await asyncio.gather(send_async(data1, p1), send_async(data2, p2))
+    """
+    import asyncio
+    return await asyncio.to_thread(send, instructions, printer_identifier, backend_identifier, blocking)
+
 def send(instructions, printer_identifier=None, backend_identifier=None, blocking=True):
     """
     Send instruction bytes to a printer.
@@ -40,23 +137,14 @@ def send(instructions, printer_identifier=None, backend_identifier=None, blockin
       'did_print': False, # If True, a print was produced. It defaults to False if the outcome is uncertain (due to a backend without read-back capability).
       'ready_for_next_job': False, # If True, the printer is ready to receive the next instructions. It defaults to False if the state is unknown.
     }
-    selected_backend = None
-    if backend_identifier:
-        selected_backend = backend_identifier
-    else:
-        try:
-            selected_backend = guess_backend(printer_identifier)
-        except:
-            logger.info("No backend stated. Selecting the default linux_kernel backend.")
-            selected_backend = 'linux_kernel'
-
-    be = backend_factory(selected_backend)
-    list_available_devices = be['list_available_devices']
-    BrotherQLBackend       = be['backend_class']
+    selected_backend = _resolve_backend(backend_identifier, printer_identifier)
+
+    be = _backend_factory(selected_backend)
+    BrotherQLBackend = be['backend_class']
 
     printer = BrotherQLBackend(printer_identifier)
 
-    start = time.time()
+    start = time.monotonic()
     logger.info('Sending instructions to the printer. Total: %d bytes.', len(instructions))
     printer.write(instructions)
     status['outcome'] = 'sent'
@@ -67,28 +155,65 @@ def send(instructions, printer_identifier=None, backend_identifier=None, blockin
         """ No need to wait for completion. The network backend doesn't support readback. """
         return status
 
-    while time.time() - start < 10:
-        data = printer.read()
+    # Ask the printer to report its status: some printers don't volunteer
+    # one on their own, which previously meant polling until the 10 s
+    # timeout expired without ever getting an answer.
+    printer.write(STATUS_REQUEST_CODE)
+
+    # Poll for a response with exponential backoff: an idle printer would
+    # otherwise be flooded with USB bulk reads returning 0 bytes.
+    # During the first 50 ms after the write we poll tightly without
+    # sleeping at all, to catch the common case of an immediate status
+    # response with minimal latency.
+    delay, max_delay = 0.002, 0.1
+    tight_poll_until = time.monotonic() + 0.05
+    prev_frame = None
+    while time.monotonic() - start < 10:
+        if time.monotonic() < tight_poll_until:
+            data = printer.read()
+        else:
+            # Let the backend block until data arrives or `delay` elapses.
+            data = printer.read(timeout=delay)
+            delay = min(delay * 2, max_delay)
         if not data:
-            time.sleep(0.005)
-            continue
-        try:
-            result = interpret_response(data)
-        except ValueError:
-            logger.error("TIME %.3f - Couln't understand response: %s", time.time()-start, data)
             continue
-        status['printer_state'] = result
-        logger.debug('TIME %.3f - result: %s', time.time()-start, result)
-        if result['errors']:
-            logger.error('Errors occured: %s', result['errors'])
-            status['outcome'] = 'error'
-            break
-        if result['status_type'] == 'Printing completed':
-            status['did_print'] = True
-            status['outcome'] = 'printed'
-        if result['status_type'] == 'Phase change' and result['phase_type'] == 'Waiting to receive':
-            status['ready_for_next_job'] = True
-        if status['did_print'] and status['ready_for_next_job']:
+        delay = 0.002
+        # A single large read may return several queued 32 byte status
+        # frames at once - handle each of them.
+        done = False
+        for frame_start in range(0, len(data), 32):
+            frame = data[frame_start:frame_start+32]
+            if frame == prev_frame:
+                # Steady-state repeat (usually 'Phase change - Printing')
+                # that was fully handled already - skip the re-parse.
+                continue
+            try:
+                result = _interpret_response(frame)
+            except (NameError, ValueError):
+                _log_unparsable_response(frame, time.monotonic()-start)
+                continue
+            prev_frame = frame
+            # The cache hands out a shared dict; give the caller its own
+            # copy so mutating status['printer_state'] (or its errors
+            # list) can't poison the cache for later jobs.
+            result = dict(result)
+            result['errors'] = list(result['errors'])
+            status['printer_state'] = result
+            logger.debug('TIME %.3f - result: %s', time.monotonic()-start, result)
+            if result['errors']:
+                logger.error('Errors occured: %s', result['errors'])
+                status['outcome'] = 'error'
+                done = True
+                break
+            if result['status_type'] == 'Printing completed':
+                status['did_print'] = True
+                status['outcome'] = 'printed'
+            if result['status_type'] == 'Phase change' and result['phase_type'] == 'Waiting to receive':
+                status['ready_for_next_job'] = True
+            if status['did_print'] and status['ready_for_next_job']:
+                done = True
+                break
+        if done:
             break
 
     if not status['did_print']:
@@ -5,10 +5,27 @@ Backend to support Brother QL-series printers via the linux kernel USB printer i
 Works on Linux.
 """
 
-import glob, os, time, select
+import os, re, time, selectors
 
 from .generic import BrotherQLBackendGeneric
 
+#: Splits an IEEE 1284 device ID into key/value elements. Only the first
+#: colon of each element separates key from value, so values containing
+#: colons are preserved; the trailing semicolon is optional.
+_1284_RE = re.compile(r'([^:;]+):([^;]*)(?:;|$)')
+
+def __parse_ieee1284_id(device_id):
+    """
+    Parse an IEEE 1284 device ID string such as
+    'MFG:Brother;CMD:PT-CBP;MDL:QL-800;CLS:PRINTER;' into a dict
+    with casefolded keys.
+    """
+    return {m.group(1).strip().casefold(): m.group(2).strip() for m in _1284_RE.finditer(device_id)}
+
+#: Parsed IEEE 1284 device IDs keyed by (path, st_mtime_ns), so repeated
+#: discover calls skip re-reading sysfs attributes that didn't change.
+_ID_CACHE = {}
+
 def list_available_devices():
     """
     List all available devices for the linux kernel backend
@@ -16,11 +33,41 @@ def list_available_devices():
     returns: devices: a list of dictionaries with the keys 'identifier' and 'instance': \
         [ {'identifier': 'file:///dev/usb/lp0', 'instance': None}, ] \
         Instance is set to None because we don't want to open (and thus potentially block) the device here.
+
+    Candidates are filtered using the IEEE 1284 device ID exposed in sysfs,
+    so that devices from other manufacturers are rejected without ever
+    opening (and thus potentially blocking) their device files.
     """
 
-    paths = glob.glob('/dev/usb/lp*')
+    devices = []
+    try:
+        # One scandir pass instead of glob's pattern compilation plus
+        # per-entry fnmatch.
+        with os.scandir('/dev/usb') as entries:
+            lp_names = sorted(e.name for e in entries if e.name.startswith('lp') and e.name[2:].isdigit())
+    except OSError:
+        return devices
+    for lp_name in lp_names:
+        path = '/dev/usb/' + lp_name
+        id_path = '/sys/class/usbmisc/%s/device/ieee1284_id' % lp_name
+        try:
+            st = os.stat(id_path)
+            key = (id_path, st.st_mtime_ns)
+            info = _ID_CACHE.get(key)
+            if info is None:
+                with open(id_path) as f:
+                    info = __parse_ieee1284_id(f.read())
+                _ID_CACHE[key] = info
+        except OSError:
+            # No sysfs attribute available - keep the device to be safe.
+            info = None
+        if info is not None:
+            manufacturer = info.get('mfg') or info.get('manufacturer') or ''
+            if manufacturer and not manufacturer.startswith('Brother'):
+                continue
+        devices.append({'identifier': 'file://' + path, 'instance': None})
 
-    return [{'identifier': 'file://' + path, 'instance': None} for path in paths]
+    return devices
 
 class BrotherQLBackendLinuxKernel(BrotherQLBackendGeneric):
     """
@@ -47,11 +94,21 @@ class BrotherQLBackendLinuxKernel(BrotherQLBackendGeneric):
 
         self.write_dev = self.dev
         self.read_dev  = self.dev
+        # Register the device once (epoll_ctl) and reuse the selector for
+        # every readiness wait instead of rebuilding fd sets per call.
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.read_dev, selectors.EVENT_READ)
+
+    def wait_readable(self, timeout):
+        return bool(self._sel.select(timeout))
 
     def _write(self, data):
         os.write(self.write_dev, data)
 
-    def _read(self, length=32):
+    def _writev(self, chunks):
+        os.writev(self.write_dev, chunks)
+
+    def _read(self, length=512):
         if self.strategy == 'try_twice':
             data = os.read(self.read_dev, length)
             if data:
@@ -60,21 +117,21 @@ class BrotherQLBackendLinuxKernel(BrotherQLBackendGeneric):
                 time.sleep(self.read_timeout)
                 return os.read(self.read_dev, length)
         elif self.strategy == 'select':
-            data = b''
-            start = time.time()
-            while (not data) and (time.time() - start < self.read_timeout):
-                result, _, _ = select.select([self.read_dev], [], [], 0)
-                if self.read_dev in result:
-                    data += os.read(self.read_dev, length)
-                if data: break
-                time.sleep(0.001)
-            if not data:
-                # one last try if still no data:
-                return os.read(self.read_dev, length)
-            else:
-                return data
+            # Block on read readiness (epoll on Linux) until data arrives
+            # or the timeout elapses - no spinning with 1 ms sleeps.
+            deadline_ns = time.monotonic_ns() + int(self.read_timeout * 1e9)
+            while True:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                if self._sel.select(remaining_ns / 1e9):
+                    return os.read(self.read_dev, length)
+            # one last try if still no data:
+            return os.read(self.read_dev, length)
         else:
             raise NotImplementedError('Unknown strategy')
 
     def _dispose(self):
+        self._sel.unregister(self.read_dev)
+        self._sel.close()
         os.close(self.dev)
@@ -62,12 +62,16 @@ class BrotherQLBackendNetwork(BrotherQLBackendGeneric):
         else:
             raise NotImplementedError('Currently the printer can be specified either via an appropriate string or via an os.open() handle.')
 
+    def wait_readable(self, timeout):
+        result, _, _ = select.select([self.s], [], [], timeout)
+        return bool(result)
+
     def _write(self, data):
         self.s.settimeout(10)
         self.s.sendall(data)
         self.s.settimeout(self.read_timeout)
 
-    def _read(self, length=32):
+    def _read(self, length=512):
         if self.strategy in ('socket_timeout', 'try_twice'):
             if self.strategy == 'socket_timeout':
                 tries = 1
@@ -82,8 +86,8 @@ class BrotherQLBackendNetwork(BrotherQLBackendGeneric):
             return b''
         elif self.strategy == 'select':
             data = b''
-            start = time.time()
-            while (not data) and (time.time() - start < self.read_timeout):
+            deadline_ns = time.monotonic_ns() + int(self.read_timeout * 1e9)
+            while (not data) and (time.monotonic_ns() < deadline_ns):
                 result, _, _ = select.select([self.s], [], [], 0)
                 if self.s in result:
                     data += self.s.recv(length)
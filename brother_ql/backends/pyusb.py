@@ -8,6 +8,7 @@ Requires PyUSB: https://github.com/walac/pyusb/
 Install via `pip install pyusb`
 """
 
+import re
 import time
 
 import usb.core
@@ -15,6 +16,53 @@ import usb.util
 
 from .generic import BrotherQLBackendGeneric
 
+#: Identifier strings per physical device. Fetching the serial number
+#: issues a USB control transfer per call, so remember the result for
+#: repeated enumerations within one process.
+_identifier_cache = {}
+
+def _identifier(dev):
+    key = (dev.bus, dev.address, dev.idVendor, dev.idProduct)
+    cached = _identifier_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        serial = usb.util.get_string(dev, 256, dev.iSerialNumber)
+        result = 'usb://0x{:04x}:0x{:04x}_{}'.format(dev.idVendor, dev.idProduct, serial)
+    except:
+        result = 'usb://0x{:04x}:0x{:04x}'.format(dev.idVendor, dev.idProduct)
+    _identifier_cache[key] = result
+    return result
+
+class _FindClass(object):
+    """
+    custom_match for usb.core.find: accepts devices of the given USB
+    class, either at device level or on any of their interfaces.
+    """
+    def __init__(self, class_):
+        self._class = class_
+    def __call__(self, device):
+        # first, let's check the device
+        if device.bDeviceClass == self._class:
+            return True
+        # ok, transverse all devices to find an interface that matches our class
+        for cfg in device:
+            # find_descriptor: what's it?
+            intf = usb.util.find_descriptor(cfg, bInterfaceClass=self._class)
+            if intf is not None:
+                return True
+        return False
+
+#: Parses identifiers like usb://0x04f9:0x2015/C5Z315686 in a single
+#: scan, validating the format at the same time. The scheme prefix and
+#: the serial number are optional.
+_USB_ID_RE = re.compile(r'^(?:usb://)?0x([0-9a-fA-F]{4}):0x([0-9a-fA-F]{4})(?:/(.*))?$')
+
+#: Matcher for USB printer class devices, instantiated once. The
+#: idVendor kwarg passed to usb.core.find filters before the Python
+#: callback runs, so this only gets invoked for Brother devices.
+_PRINTER_MATCHER = _FindClass(7)
+
 def list_available_devices():
     """
     List all available devices for the respective backend
@@ -24,32 +72,10 @@ def list_available_devices():
         The 'identifier' is of the format idVendor:idProduct_iSerialNumber.
     """
 
-    class find_class(object):
-        def __init__(self, class_):
-            self._class = class_
-        def __call__(self, device):
-            # first, let's check the device
-            if device.bDeviceClass == self._class:
-                return True
-            # ok, transverse all devices to find an interface that matches our class
-            for cfg in device:
-                # find_descriptor: what's it?
-                intf = usb.util.find_descriptor(cfg, bInterfaceClass=self._class)
-                if intf is not None:
-                    return True
-            return False
-
     # only Brother printers
-    printers = usb.core.find(find_all=1, custom_match=find_class(7), idVendor=0x04f9)
-
-    def identifier(dev):
-        try:
-            serial = usb.util.get_string(dev, 256, dev.iSerialNumber)
-            return 'usb://0x{:04x}:0x{:04x}_{}'.format(dev.idVendor, dev.idProduct, serial)
-        except:
-            return 'usb://0x{:04x}:0x{:04x}'.format(dev.idVendor, dev.idProduct)
+    printers = usb.core.find(find_all=1, custom_match=_PRINTER_MATCHER, idVendor=0x04f9)
 
-    return [{'identifier': identifier(printer), 'instance': printer} for printer in printers]
+    return [{'identifier': _identifier(printer), 'instance': printer} for printer in printers]
 
 class BrotherQLBackendPyUSB(BrotherQLBackendGeneric):
     """
@@ -65,19 +91,28 @@ class BrotherQLBackendPyUSB(BrotherQLBackendGeneric):
         self.dev = None
         self.read_timeout =    10. # ms
         self.write_timeout = 15000. # ms
-        # strategy : try_twice or select
+        # strategy : try_twice
         self.strategy = 'try_twice'
         if isinstance(device_specifier, str):
-            if device_specifier.startswith('usb://'):
-                device_specifier = device_specifier[6:]
-            vendor_product, _, serial = device_specifier.partition('/')
-            vendor, _, product = vendor_product.partition(':')
-            vendor, product = int(vendor, 16), int(product, 16)
-            for result in list_available_devices():
-                printer = result['instance']
-                if printer.idVendor == vendor and printer.idProduct == product or (serial and printer.iSerialNumber == serial):
-                    self.dev = printer
-                    break
+            m = _USB_ID_RE.match(device_specifier)
+            if not m:
+                raise ValueError('Invalid device specifier: %s' % device_specifier)
+            vendor, product = int(m.group(1), 16), int(m.group(2), 16)
+            serial = m.group(3) or ''
+            # Look the device up directly instead of enumerating every
+            # Brother printer (and fetching their descriptors) just to
+            # find the one the user already named.
+            match = None
+            if serial:
+                def match(dev):
+                    # Reading the serial is a control transfer that can
+                    # fail on devices we lack permissions for - skip
+                    # those instead of aborting the whole search.
+                    try:
+                        return usb.util.get_string(dev, 256, dev.iSerialNumber) == serial
+                    except usb.core.USBError:
+                        return False
+            self.dev = usb.core.find(idVendor=vendor, idProduct=product, custom_match=match)
             if self.dev is None:
                 raise ValueError('Device not found')
         elif isinstance(device_specifier, usb.core.Device):
@@ -114,31 +149,20 @@ class BrotherQLBackendPyUSB(BrotherQLBackendGeneric):
         self.read_dev  = ep_in
 
     def _raw_read(self, length):
-        # pyusb Device.read() operations return array() type - let's convert it to bytes()
-        return bytes(self.read_dev.read(length))
+        # pyusb read() operations return array() type - convert it to bytes()
+        # via tobytes(), a single C-level copy instead of the per-element
+        # bytes(iterable) fallback.
+        buf = self.read_dev.read(length)
+        return buf.tobytes() if hasattr(buf, 'tobytes') else bytes(buf)
 
-    def _read(self, length=32):
+    def _read(self, length=512):
         if self.strategy == 'try_twice':
             data = self._raw_read(length)
             if data:
-                return bytes(data)
+                return data
             else:
                 time.sleep(self.read_timeout/1000.)
                 return self._raw_read(length)
-        elif self.strategy == 'select':
-            data = b''
-            start = time.time()
-            while (not data) and (time.time() - start < self.read_timeout/1000.):
-                result, _, _ = select.select([self.read_dev], [], [], 0)
-                if self.read_dev in result:
-                    data += self._raw_read(length)
-                if data: break
-                time.sleep(0.001)
-            if not data:
-                # one last try if still no data:
-                return self._raw_read(length)
-            else:
-                return data
         else:
             raise NotImplementedError('Unknown strategy')
 
@@ -18,7 +18,7 @@ class BrotherQL_USBdebug(object):
         self.sleep_time = 0.0
         self.sleep_before_read = 0.0
         self.continue_reading_for = 3.0
-        self.start = time.time()
+        self.start = time.monotonic()
         self.interactive = False
         self.merge_specific_instructions = True
         if type(instructions_data) in (str,):
@@ -33,14 +33,20 @@ class BrotherQL_USBdebug(object):
             logger.warning('Received response before sending instructions: {}'.format(hex_format(response)))
 
     def continue_reading(self, seconds=3.0):
-        start = time.time()
-        while time.time() - start < seconds:
+        deadline = time.monotonic() + seconds
+        # Exponential backoff: poll quickly right after an instruction,
+        # back off to 50 ms while the printer stays silent.
+        delay = 0.001
+        while time.monotonic() < deadline:
             data = self.be.read()
             if data != b'':
-                global_time = time.time() - self.start
+                global_time = time.monotonic() - self.start
                 print('TIME %.2f' % global_time)
                 self.log_interp_response(data)
-            time.sleep(0.001)
+                delay = 0.001
+            else:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
 
     def log_interp_response(self, data):
         try:
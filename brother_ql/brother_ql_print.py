@@ -73,8 +73,11 @@ def main():
         "We need to search for available devices and select the first."
         if not available_devices:
             sys.exit("No printer found")
-        identifier = available_devices[0]['identifier']
-        print("Selecting first device %s" % identifier)
+        device = available_devices[0]
+        # Reuse the instance opened during discovery (if the backend
+        # provides one) instead of enumerating the bus a second time.
+        identifier = device['instance'] if device['instance'] is not None else device['identifier']
+        print("Selecting first device %s" % device['identifier'])
     else:
         "A string identifier for the device was given, let's use it."
         identifier = args.printer
@@ -2,22 +2,54 @@
 
 # Python standard library
 import logging
+from collections.abc import Sequence
 
 # external dependencies
 import click
 
 # imports from this very package
-from brother_ql.devicedependent import models, label_sizes, label_type_specs, DIE_CUT_LABEL, ENDLESS_LABEL, ROUND_DIE_CUT_LABEL
-from brother_ql.backends import available_backends, backend_factory
+from brother_ql.backends import available_backends
 
 
 logger = logging.getLogger('brother_ql')
 
 
+class _LazyChoices(Sequence):
+    """
+    A sequence materialized on first access.
+
+    Used for click.Choice values that come from modules which are
+    expensive to import, so `brother_ql --help` and commands that don't
+    need them avoid the import entirely.
+    """
+    def __init__(self, load):
+        self._load = load
+        self._items = None
+
+    def _materialize(self):
+        if self._items is None:
+            self._items = list(self._load())
+        return self._items
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __len__(self):
+        return len(self._materialize())
+
+def _model_choices():
+    from brother_ql.devicedependent import models
+    return models
+
+def _label_choices():
+    from brother_ql.devicedependent import label_sizes
+    return label_sizes
+
+
 printer_help = "The identifier for the printer. This could be a string like tcp://192.168.1.21:9100 for a networked printer or usb://0x04f9:0x2015/000M6Z401370 for a printer connected via USB."
 @click.group()
 @click.option('-b', '--backend', type=click.Choice(available_backends), envvar='BROTHER_QL_BACKEND')
-@click.option('-m', '--model', type=click.Choice(models), envvar='BROTHER_QL_MODEL')
+@click.option('-m', '--model', type=click.Choice(_LazyChoices(_model_choices)), envvar='BROTHER_QL_MODEL')
 @click.option('-p', '--printer', metavar='PRINTER_IDENTIFIER', envvar='BROTHER_QL_PRINTER', help=printer_help)
 @click.option('--debug', is_flag=True)
 @click.version_option()
@@ -63,6 +95,7 @@ def models_cmd(ctx, *args, **kwargs):
     """
     List the choices for --model
     """
+    from brother_ql.devicedependent import models
     print('Supported models:')
     for model in models: print(" " + model)
 
@@ -72,6 +105,7 @@ def labels(ctx, *args, **kwargs):
     """
     List the choices for --label
     """
+    from brother_ql.devicedependent import label_sizes
     from brother_ql.output_helpers import textual_label_description
     print(textual_label_description(label_sizes))
 
@@ -81,8 +115,8 @@ def env(ctx, *args, **kwargs):
     """
     print debug info about running environment
     """
-    import sys, platform, os, shutil
-    from pkg_resources import get_distribution, working_set
+    import sys, platform, os, re, shutil
+    from importlib.metadata import distribution, version, PackageNotFoundError
     print("\n##################\n")
     print("Information about the running environment of brother_ql.")
     print("(Please provide this information when reporting any issue.)\n")
@@ -96,8 +130,8 @@ def env(ctx, *args, **kwargs):
     print("  *", py_version)
     # brother_ql
     print("About the brother_ql package:")
-    pkg = get_distribution('brother_ql')
-    print("  * package location:", pkg.location)
+    pkg = distribution('brother_ql')
+    print("  * package location:", pkg.locate_file(''))
     print("  * package version: ", pkg.version)
     try:
         cli_loc = shutil.which('brother_ql')
@@ -109,18 +143,24 @@ def env(ctx, *args, **kwargs):
     fmt = "  {req:14s} | {spec:10s} | {ins_vers:17s}"
     print(fmt.format(req='requirement', spec='requested', ins_vers='installed version'))
     print(fmt.format(req='-' * 14, spec='-'*10, ins_vers='-'*17))
-    requirements = list(pkg.requires())
-    requirements.sort(key=lambda x: x.project_name)
-    for req in requirements:
-        proj = req.project_name
-        req_pkg = get_distribution(proj)
-        spec = ' '.join(req.specs[0]) if req.specs else 'any'
-        print(fmt.format(req=proj, spec=spec, ins_vers=req_pkg.version))
+    requirements = []
+    for req in (pkg.requires or []):
+        # entries look like 'pillow (>=3.3)' or 'attrs; extra == "docs"'
+        req, _, marker = req.partition(';')
+        m = re.match(r'([A-Za-z0-9._-]+)\s*(.*)', req.strip())
+        requirements.append((m.group(1), m.group(2).strip('()') or 'any'))
+    requirements.sort()
+    for proj, spec in requirements:
+        try:
+            ins_vers = version(proj)
+        except PackageNotFoundError:
+            ins_vers = 'not installed'
+        print(fmt.format(req=proj, spec=spec, ins_vers=ins_vers))
     print("\n##################\n")
 
 @cli.command('print', short_help='Print a label')
 @click.argument('images', nargs=-1, type=click.File('rb'), metavar='IMAGE [IMAGE] ...')
-@click.option('-l', '--label', type=click.Choice(label_sizes), envvar='BROTHER_QL_LABEL', help='The label (size, type - die-cut or endless). Run `brother_ql info labels` for a full list including ideal pixel dimensions.')
+@click.option('-l', '--label', type=click.Choice(_LazyChoices(_label_choices)), envvar='BROTHER_QL_LABEL', help='The label (size, type - die-cut or endless). Run `brother_ql info labels` for a full list including ideal pixel dimensions.')
 @click.option('-r', '--rotate', type=click.Choice(('auto', '0', '90', '180', '270')), default='auto', help='Rotate the image (counterclock-wise) by this amount of degrees.')
 @click.option('-t', '--threshold', type=float, default=70.0, help='The threshold value (in percent) to discriminate between black and white pixels.')
 @click.option('-d', '--dither', is_flag=True, help='Enable dithering when converting the image to b/w. If set, --threshold is meaningless.')
@@ -14,6 +14,16 @@ logger = logging.getLogger(__name__)
 
 logging.getLogger("PIL.PngImagePlugin").setLevel(logging.WARNING)
 
+#: Channel lookup tables to isolate the red and black portions of an
+#: image when printing on black/red/white tape. Precomputed once so
+#: :py:func:`filtered_hsv` can hand them straight to ``Image.point``.
+_RED_FILTER_H   = bytes(255 if (h <  40 or h > 210) else 0 for h in range(256))
+_RED_FILTER_S   = bytes(255 if s > 100 else 0 for s in range(256))
+_RED_FILTER_V   = bytes(255 if v >  80 else 0 for v in range(256))
+_BLACK_FILTER_H = bytes(255 for h in range(256))
+_BLACK_FILTER_S = bytes(255 for s in range(256))
+_BLACK_FILTER_V = bytes(255 if v <  80 else 0 for v in range(256))
+
 def convert(qlr, images, label,  **kwargs):
     r"""Converts one or more images to a raster instruction file.
 
@@ -127,18 +137,12 @@ def convert(qlr, images, label,  **kwargs):
             im = new_im
 
         if red:
-            filter_h = lambda h: 255 if (h <  40 or h > 210) else 0
-            filter_s = lambda s: 255 if s > 100 else 0
-            filter_v = lambda v: 255 if v >  80 else 0
-            red_im = filtered_hsv(im, filter_h, filter_s, filter_v)
+            red_im = filtered_hsv(im, _RED_FILTER_H, _RED_FILTER_S, _RED_FILTER_V)
             red_im = red_im.convert("L")
             red_im = PIL.ImageOps.invert(red_im)
             red_im = red_im.point(lambda x: 0 if x < threshold else 255, mode="1")
 
-            filter_h = lambda h: 255
-            filter_s = lambda s: 255
-            filter_v = lambda v: 255 if v <  80 else 0
-            black_im = filtered_hsv(im, filter_h, filter_s, filter_v)
+            black_im = filtered_hsv(im, _BLACK_FILTER_H, _BLACK_FILTER_S, _BLACK_FILTER_V)
             black_im = black_im.convert("L")
             black_im = PIL.ImageOps.invert(black_im)
             black_im = black_im.point(lambda x: 0 if x < threshold else 255, mode="1")
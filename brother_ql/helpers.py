@@ -10,27 +10,43 @@ class ElementsManager(object):
     * can be compared for equality against each other
     * have the attribute .identifier
     """
-    DEFAULT_ELEMENTS = []
+    DEFAULT_ELEMENTS = ()
     ELEMENT_NAME = "element"
 
     def __init__(self, elements=None):
         if elements:
             self._elements = elements
         else:
-            self._elements = self.DEFAULT_ELEMENTS
+            # DEFAULT_ELEMENTS is a shared immutable tuple; copy it into a
+            # list only when a manager is actually instantiated, so
+            # register/deregister never mutate the class-level registry.
+            self._elements = list(self.DEFAULT_ELEMENTS)
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        self._by_identifier = {element.identifier: element for element in self._elements}
 
     def register(self, element, pos=-1):
         if element not in self._elements:
-            if pos == -1: pos = len(self._labels)
-            self._labels.insert(len(self._labels), label)
+            if pos == -1: pos = len(self._elements)
+            self._elements.insert(pos, element)
+            self._rebuild_index()
         else:
             logger.warn("Won't register %s as it's already present: %s", self.ELEMENT_NAME, element)
 
     def deregister(self, element):
         if element in self._elements:
             self._elements.remove(element)
+            self._rebuild_index()
         else:
-            logger.warn("Trying to deregister a %s that's not registered currently: %s", self.ELEMENT_NAME, label)
+            logger.warn("Trying to deregister a %s that's not registered currently: %s", self.ELEMENT_NAME, element)
+
+    def get_by_identifier(self, identifier):
+        """
+        Look up an element by its identifier in O(1).
+        Returns None if no such element is registered.
+        """
+        return self._by_identifier.get(identifier)
 
     def iter_identifiers(self):
         for element in self._elements:
@@ -1,23 +1,37 @@
 from PIL import Image
-import colorsys
+import numpy as np
+
+def _as_lut(filter_):
+    """
+    Accept a filter either as a 256-entry bytes lookup table or as a
+    callable; callables are evaluated once per possible channel value.
+    """
+    if isinstance(filter_, (bytes, bytearray)):
+        return bytes(filter_)
+    return bytes(filter_(i) & 0xFF for i in range(256))
 
 def filtered_hsv(im, filter_h, filter_s, filter_v, default_col=(255,255,255)):
-    """ https://stackoverflow.com/a/22237709/183995 """
+    """
+    https://stackoverflow.com/a/22237709/183995
+
+    The channel filters can be given as 256-entry bytes lookup tables
+    (preferred, applied entirely in PIL's C code) or as callables.
+    """
 
     hsv_im = im.convert('HSV')
     H, S, V = 0, 1, 2
     hsv = hsv_im.split()
-    mask_h = hsv[H].point(filter_h)
-    mask_s = hsv[S].point(filter_s)
-    mask_v = hsv[V].point(filter_v)
-
-    Mdat = []
-    for h, s, v in zip(mask_h.getdata(), mask_s.getdata(), mask_v.getdata()):
-        Mdat.append(255 if (h and s and v) else 0)
+    mask_h = hsv[H].point(_as_lut(filter_h))
+    mask_s = hsv[S].point(_as_lut(filter_s))
+    mask_v = hsv[V].point(_as_lut(filter_v))
 
-    mask = mask_h
-    mask.putdata(Mdat)
+    # Combine the three channel masks in one vectorized pass instead of
+    # looping over every pixel in Python.
+    h = np.asarray(mask_h)
+    s = np.asarray(mask_s)
+    v = np.asarray(mask_v)
+    Mdat = np.where(h.astype(bool) & s.astype(bool) & v.astype(bool), 255, 0).astype(np.uint8)
+    mask = Image.fromarray(Mdat, mode='L')
 
-    filtered_im = Image.new("RGB", im.size, color=default_col)
-    filtered_im.paste(im, None, mask)
-    return filtered_im
+    background = Image.new("RGB", im.size, color=default_col)
+    return Image.composite(im, background, mask)
@@ -3,8 +3,6 @@ from attr import attrs, attrib
 from typing import List, Tuple
 from enum import IntEnum
 
-import copy
-
 from brother_ql.helpers import ElementsManager
 
 class FormFactor(IntEnum):
@@ -120,5 +118,5 @@ ALL_LABELS = (
 )
 
 class LabelsManager(ElementsManager):
-    DEFAULT_ELEMENTS = copy.copy(ALL_LABELS)
+    DEFAULT_ELEMENTS = tuple(ALL_LABELS)
     ELEMENT_NAME = "label"
@@ -30,6 +30,23 @@ from io import BytesIO
 
 logger = logging.getLogger(__name__)
 
+#: The opcode byte sequences of the raster command language, precomputed
+#: once at module level instead of being spelled out in each method.
+OP_INITIALIZE    = b'\x1B\x40'          # ESC @
+OP_STATUS_INFO   = b'\x1B\x69\x53'      # ESC i S
+OP_SWITCH_MODE   = b'\x1B\x69\x61\x01'  # ESC i a
+OP_MEDIA_QUALITY = b'\x1B\x69\x7A'      # ESC i z
+OP_AUTOCUT       = b'\x1B\x69\x4D'      # ESC i M
+OP_CUT_EVERY     = b'\x1B\x69\x41'      # ESC i A
+OP_EXPANDED_MODE = b'\x1B\x69\x4B'      # ESC i K
+OP_MARGINS       = b'\x1B\x69\x64'      # ESC i d
+OP_COMPRESSION   = b'\x4D'              # M
+
+#: Precomputed single-byte bytes objects. Indexing this table avoids
+#: allocating a fresh object for every bytes([value]) call on the
+#: instruction-building path.
+_ONE_BYTE = tuple(bytes((i,)) for i in range(256))
+
 class BrotherQLRaster(object):
 
     """
@@ -63,10 +80,9 @@ class BrotherQLRaster(object):
         self.no_chain_printing = False
 
         self.num_invalidate_bytes = 200
-        for m in ModelsManager().iter_elements():
-            if self.model == m.identifier:
-                self.num_invalidate_bytes = m.num_invalidate_bytes
-                break
+        m = ModelsManager().get_by_identifier(self.model)
+        if m is not None:
+            self.num_invalidate_bytes = m.num_invalidate_bytes
 
     def _warn(self, problem, kind=BrotherQLRasterError):
         """
@@ -98,11 +114,11 @@ class BrotherQLRaster(object):
 
     def add_initialize(self):
         self.page_number = 0
-        self.data += b'\x1B\x40' # ESC @
+        self.data += OP_INITIALIZE
 
     def add_status_information(self):
         """ Status Information Request """
-        self.data += b'\x1B\x69\x53' # ESC i S
+        self.data += OP_STATUS_INFO
 
     def add_switch_mode(self):
         """
@@ -113,7 +129,7 @@ class BrotherQLRaster(object):
         if self.model not in modesetting:
             self._unsupported("Trying to switch the operating mode on a printer that doesn't support the command.")
             return
-        self.data += b'\x1B\x69\x61\x01' # ESC i a
+        self.data += OP_SWITCH_MODE
 
     def add_invalidate(self):
         """ clear command buffer """
@@ -133,32 +149,32 @@ class BrotherQLRaster(object):
 
     @mtype.setter
     def mtype(self, value):
-        self._mtype = bytes([value & 0xFF])
+        self._mtype = _ONE_BYTE[value & 0xFF]
 
     @mwidth.setter
     def mwidth(self, value):
-        self._mwidth = bytes([value & 0xFF])
+        self._mwidth = _ONE_BYTE[value & 0xFF]
 
     @mlength.setter
     def mlength(self, value):
-        self._mlength = bytes([value & 0xFF])
+        self._mlength = _ONE_BYTE[value & 0xFF]
 
     @pquality.setter
     def pquality(self, value):
         self._pquality = bool(value)
 
     def add_media_and_quality(self, rnumber):
-        self.data += b'\x1B\x69\x7A' # ESC i z
+        self.data += OP_MEDIA_QUALITY
         valid_flags = 0x80
         valid_flags |= (self._mtype is not None) << 1
         valid_flags |= (self._mwidth is not None) << 2
         valid_flags |= (self._mlength is not None) << 3
         valid_flags |= self._pquality << 6
-        self.data += bytes([valid_flags])
+        self.data += _ONE_BYTE[valid_flags]
         vals = [self._mtype, self._mwidth, self._mlength]
         self.data += b''.join(b'\x00' if val is None else val for val in vals)
         self.data += struct.pack('<L', rnumber)
-        self.data += bytes([0 if self.page_number == 0 else 1])
+        self.data += _ONE_BYTE[0 if self.page_number == 0 else 1]
         self.data += b'\x00'
         # INFO:  media/quality (1B 69 7A) --> found! (payload: 8E 0A 3E 00 D2 00 00 00 00 00)
 
@@ -166,11 +182,11 @@ class BrotherQLRaster(object):
         if self.model not in cuttingsupport:
             self._unsupported("Trying to call add_autocut with a printer that doesn't support it")
             return
-        self.data += b'\x1B\x69\x4D' # ESC i M
+        self.data += OP_AUTOCUT
         if self.model.startswith('PT'):
-            self.data += bytes([autocut << 5])
+            self.data += _ONE_BYTE[autocut << 5]
         else:
-            self.data += bytes([autocut << 6])
+            self.data += _ONE_BYTE[autocut << 6]
 
     def add_cut_every(self, n=1):
         if self.model not in cuttingsupport:
@@ -178,8 +194,8 @@ class BrotherQLRaster(object):
             return
         if self.model.startswith('PT'):
             return
-        self.data += b'\x1B\x69\x41' # ESC i A
-        self.data += bytes([n & 0xFF])
+        self.data += OP_CUT_EVERY
+        self.data += _ONE_BYTE[n & 0xFF]
 
     def add_expanded_mode(self):
         if self.model not in expandedmode:
@@ -188,7 +204,7 @@ class BrotherQLRaster(object):
         if self.two_color_printing and not self.two_color_support:
             self._unsupported("Trying to set two_color_printing in expanded mode on a printer that doesn't support it.")
             return
-        self.data += b'\x1B\x69\x4B' # ESC i K
+        self.data += OP_EXPANDED_MODE
         flags = 0x00
         if self.model.startswith('PT'):
             flags |= self.half_cut << 2
@@ -198,10 +214,10 @@ class BrotherQLRaster(object):
             flags |= self.cut_at_end << 3
             flags |= self.dpi_600 << 6
             flags |= self.two_color_printing << 0
-        self.data += bytes([flags])
+        self.data += _ONE_BYTE[flags]
 
     def add_margins(self, dots=0x23):
-        self.data += b'\x1B\x69\x64' # ESC i d
+        self.data += OP_MARGINS
         self.data += struct.pack('<H', dots)
 
     def add_compression(self, compression=True):
@@ -217,8 +233,8 @@ class BrotherQLRaster(object):
             self._unsupported("Trying to set compression on a printer that doesn't support it")
             return
         self._compression = compression
-        self.data += b'\x4D' # M
-        self.data += bytes([compression << 1])
+        self.data += OP_COMPRESSION
+        self.data += _ONE_BYTE[compression << 1]
 
     def get_pixel_width(self):
         try:
@@ -269,7 +285,7 @@ class BrotherQLRaster(object):
                         file_str.write(b'\x77\x01' if i == 0 else b'\x77\x02')
                     else:
                         file_str.write(b'\x67\x00')
-                    file_str.write(bytes([translen]))
+                    file_str.write(_ONE_BYTE[translen])
                 file_str.write(row)
             start += row_len
         self.data += file_str.getvalue()
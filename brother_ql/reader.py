@@ -5,8 +5,8 @@ import io
 import logging
 import sys
 
+import numpy as np
 from PIL import Image
-from PIL.ImageOps import colorize
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,32 @@ OPCODES = {
     b'\x80\x20\x42':         ('status response',29, "A status response received from the printer"),
 }
 
+#: Byte-level trie over the OPCODES signatures: nested dicts keyed by the
+#: byte value, with the matched signature stored under the None sentinel.
+#: Resolving an opcode walks at most len(signature) dict lookups instead
+#: of testing every signature with startswith().
+OPCODE_TRIE = {}
+for _opcode in OPCODES:
+    _node = OPCODE_TRIE
+    for _byte in _opcode:
+        _node = _node.setdefault(_byte, {})
+    _node[None] = _opcode
+del _node, _opcode, _byte
+
+#: Opcode signature -> instruction name, so the hot parsing loops don't
+#: re-index the OPCODES definition tuples per instruction.
+OPCODE_NAME = {opcode: definition[0] for opcode, definition in OPCODES.items()}
+
+#: The signatures of all raster data opcodes.
+RASTER_OPCODES = frozenset(opcode for opcode, definition in OPCODES.items() if 'raster' in definition[0])
+
+#: Length of the longest opcode signature.
+_MAX_OPCODE_LEN = max(len(opcode) for opcode in OPCODES)
+
+#: Precompiled little-endian field decoders for the hot parsing paths.
+_LE_U16 = struct.Struct('<H').unpack_from
+_LE_U32 = struct.Struct('<L').unpack_from
+
 dot_widths = {
   62: 90*8,
 }
@@ -62,6 +88,11 @@ RESP_ERROR_INFORMATION_2_DEF = {
   7: 'System error',
 }
 
+#: The error definitions keyed by bit mask instead of bit position, so
+#: set bits can be decoded directly.
+_E1_BY_MASK = {1 << bit: text for bit, text in RESP_ERROR_INFORMATION_1_DEF.items()}
+_E2_BY_MASK = {1 << bit: text for bit, text in RESP_ERROR_INFORMATION_2_DEF.items()}
+
 RESP_MEDIA_TYPES = {
   0x00: 'No media',
   0x01: 'Laminated tape',
@@ -117,7 +148,7 @@ RESP_BYTE_NAMES = [
 ]
 
 def hex_format(data):
-    return ' '.join('{:02X}'.format(byte) for byte in data)
+    return bytes(data).hex(' ').upper()
 
 def chunker(data, raise_exception=False):
     """
@@ -127,13 +158,60 @@ def chunker(data, raise_exception=False):
 
     returns: list of bytes objects
     """
-    instructions = []
-    data = bytes(data)
+    if not isinstance(data, (bytes, memoryview)):
+        data = bytes(data)
+    # Work on a memoryview so consuming the head of the stream below is
+    # a zero-copy slice instead of reallocating the remaining buffer.
+    data = memoryview(data)
+    while len(data) > 0:
+        try:
+            opcode = match_opcode(data)
+        except KeyError:
+            msg = 'unknown opcode starting with {}...)'.format(hex_format(data[0:4]))
+            if raise_exception:
+                raise ValueError(msg)
+            else:
+                logger.warning(msg)
+                data = data[1:]
+                continue
+        opcode_def = OPCODES[opcode]
+        opcode_name = opcode_def[0]
+        num_bytes = len(opcode)
+        if opcode_def[1] > 0: num_bytes += opcode_def[1]
+        elif opcode_name in ('raster QL', '2-color raster QL'):
+            num_bytes += data[2] + 2
+        elif opcode_name in ('raster P-touch',):
+            num_bytes += _LE_U16(data, 1)[0] + 2
+        yield bytes(data[:num_bytes])
+        data = data[num_bytes:]
+
+def chunker_stream(brother_file, raise_exception=False, buffer_size=8192):
+    """
+    Incremental variant of chunker() reading from a file object.
+
+    Instructions are read and yielded one by one, so peak memory stays
+    at one read block plus one instruction instead of the whole print
+    job. Unknown opcodes are skipped bytewise with a warning, or raise
+    a ValueError if raise_exception is set to True.
+    """
+    data = b''
+    eof = False
+
+    def top_up(n):
+        nonlocal data, eof
+        while not eof and len(data) < n:
+            block = brother_file.read(max(buffer_size, n - len(data)))
+            if block:
+                data += block
+            else:
+                eof = True
+
     while True:
+        top_up(_MAX_OPCODE_LEN)
         if len(data) == 0: break
         try:
             opcode = match_opcode(data)
-        except:
+        except KeyError:
             msg = 'unknown opcode starting with {}...)'.format(hex_format(data[0:4]))
             if raise_exception:
                 raise ValueError(msg)
@@ -142,42 +220,128 @@ def chunker(data, raise_exception=False):
                 data = data[1:]
                 continue
         opcode_def = OPCODES[opcode]
+        opcode_name = opcode_def[0]
         num_bytes = len(opcode)
         if opcode_def[1] > 0: num_bytes += opcode_def[1]
-        elif opcode_def[0] in ('raster QL', '2-color raster QL'):
+        elif opcode_name in ('raster QL', '2-color raster QL'):
             num_bytes += data[2] + 2
-        elif opcode_def[0] in ('raster P-touch',):
-            num_bytes += data[1] + data[2]*256 + 2
-        #payload = data[len(opcode):num_bytes]
-        instructions.append(data[:num_bytes])
-        yield instructions[-1]
+        elif opcode_name in ('raster P-touch',):
+            num_bytes += _LE_U16(data, 1)[0] + 2
+        top_up(num_bytes)
+        yield data[:num_bytes]
         data = data[num_bytes:]
-    #return instructions
 
 def match_opcode(data):
-    matching_opcodes = [opcode for opcode in OPCODES.keys() if data.startswith(opcode)]
-    assert len(matching_opcodes) == 1
-    return matching_opcodes[0]
+    node = OPCODE_TRIE
+    match = None
+    for byte in data:
+        node = node.get(byte)
+        if node is None:
+            break
+        if None in node:
+            match = node[None]
+    if match is None:
+        raise KeyError('unknown opcode starting with {}...'.format(hex_format(data[0:4])))
+    return match
+
+class _RasterRows:
+    """
+    Contiguous storage for decoded raster rows of one color.
+
+    Rows are appended into a single growing bytearray instead of a list
+    of small per-row bytes objects, so building the final image needs no
+    join pass and no per-row object overhead. Empty (zero raster) rows
+    only bump the row counter until the row stride is known from the
+    first real row; rows shorter than the stride are zero-padded and a
+    longer row re-pads the stored rows to the new stride, matching the
+    old pad-to-widest-row behaviour.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.row_length = 0
+        self._rows = 0
+        self._pending_zeros = 0
+
+    def __len__(self):
+        return self._rows
+
+    def append(self, row):
+        num_bytes = len(row)
+        self._rows += 1
+        if num_bytes == 0:
+            if self.row_length:
+                self.buffer += bytes(self.row_length)
+            else:
+                self._pending_zeros += 1
+            return
+        if not self.row_length:
+            self.row_length = num_bytes
+            if self._pending_zeros:
+                self.buffer += bytes(self.row_length * self._pending_zeros)
+                self._pending_zeros = 0
+        elif num_bytes < self.row_length:
+            row = row + bytes(self.row_length - num_bytes)
+        elif num_bytes > self.row_length:
+            self._restride(num_bytes)
+        self.buffer += row
+
+    def _restride(self, new_length):
+        """ Zero-pad every stored row out to the new, longer stride. """
+        old_length = self.row_length
+        stored = len(self.buffer) // old_length
+        new_buffer = bytearray(stored * new_length)
+        for i in range(stored):
+            new_buffer[i*new_length:i*new_length + old_length] = self.buffer[i*old_length:(i+1)*old_length]
+        self.buffer = new_buffer
+        self.row_length = new_length
+
+    def tobytes(self):
+        return bytes(self.buffer)
+
+def _packbits_decode(rpl):
+    """
+    Decode a PackBits compressed raster payload into plain bytes.
+
+    Runs are expanded with bytes repetition and literals are copied as
+    slices, so the per-byte work happens in C; the output accumulates in
+    a bytearray instead of reallocating a bytes object per chunk.
+    """
+    out = bytearray()
+    i = 0
+    n = len(rpl)
+    while i < n:
+        num = rpl[i]
+        if num & 0x80:
+            # run: two's complement count, repeated following byte
+            out += rpl[i+1:i+2] * (257 - num)
+            i += 2
+        else:
+            # literal: the following num+1 bytes verbatim
+            out += rpl[i+1:i+2+num]
+            i += 2 + num
+    return bytes(out)
 
 def interpret_response(data):
-    data = bytes(data)
+    if not isinstance(data, bytes):
+        data = bytes(data)
     if len(data) < 32:
         raise NameError('Insufficient amount of data received', hex_format(data))
     if not data.startswith(b'\x80\x20\x42'):
         raise NameError("Printer response doesn't start with the usual header (80:20:42)", hex_format(data))
-    for i, byte_name in enumerate(RESP_BYTE_NAMES):
-        logger.debug('Byte %2d %24s %02X', i, byte_name+':', data[i])
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, byte_name in enumerate(RESP_BYTE_NAMES):
+            logger.debug('Byte %2d %24s %02X', i, byte_name+':', data[i])
     errors = []
-    error_info_1 = data[8]
-    error_info_2 = data[9]
-    for error_bit in RESP_ERROR_INFORMATION_1_DEF:
-        if error_info_1 & (1 << error_bit):
-            logger.error('Error: ' + RESP_ERROR_INFORMATION_1_DEF[error_bit])
-            errors.append(RESP_ERROR_INFORMATION_1_DEF[error_bit])
-    for error_bit in RESP_ERROR_INFORMATION_2_DEF:
-        if error_info_2 & (1 << error_bit):
-            logger.error('Error: ' + RESP_ERROR_INFORMATION_2_DEF[error_bit])
-            errors.append(RESP_ERROR_INFORMATION_2_DEF[error_bit])
+    # Only visit the set bits (x & -x isolates the lowest one); the
+    # common all-clear case exits immediately.
+    for error_info, by_mask in ((data[8], _E1_BY_MASK), (data[9], _E2_BY_MASK)):
+        while error_info:
+            mask = error_info & -error_info
+            error_info ^= mask
+            error = by_mask[mask]
+            logger.error('Error: ' + error)
+            errors.append(error)
 
     media_width  = data[10]
     media_length = data[17]
@@ -220,21 +384,27 @@ def merge_specific_instructions(chunks, join_preamble=True, join_raster=True):
     identical opcodes into "large instructions".
     """
     new_instructions = []
-    last_opcode = None
-    instruction_buffer = b''
+    last_opcode = ''
+    last_raster = False
+    # Collect the parts of a merged instruction in a list and join once
+    # per flush; repeated bytes += would copy the whole buffer each time.
+    buffer_parts = []
     for instruction in chunks:
         opcode = match_opcode(instruction)
-        if   join_preamble and OPCODES[opcode][0] == 'preamble' and last_opcode == 'preamble':
-            instruction_buffer += instruction
-        elif join_raster   and 'raster' in OPCODES[opcode][0] and 'raster' in last_opcode:
-            instruction_buffer += instruction
+        opcode_name = OPCODE_NAME[opcode]
+        is_raster = opcode in RASTER_OPCODES
+        if   join_preamble and opcode_name == 'preamble' and last_opcode == 'preamble':
+            buffer_parts.append(instruction)
+        elif join_raster   and is_raster and last_raster:
+            buffer_parts.append(instruction)
         else:
-            if instruction_buffer:
-                new_instructions.append(instruction_buffer)
-            instruction_buffer = instruction
-        last_opcode = OPCODES[opcode][0]
-    if instruction_buffer:
-        new_instructions.append(instruction_buffer)
+            if buffer_parts:
+                new_instructions.append(b''.join(buffer_parts))
+            buffer_parts = [instruction]
+        last_opcode = opcode_name
+        last_raster = is_raster
+    if buffer_parts:
+        new_instructions.append(b''.join(buffer_parts))
     return new_instructions
 
 class BrotherQLReader(object):
@@ -246,111 +416,111 @@ class BrotherQLReader(object):
         self.brother_file = brother_file
         self.mwidth, self.mheight = None, None
         self.raster_no = None
-        self.black_rows = []
-        self.red_rows = []
+        self.black_rows = _RasterRows()
+        self.red_rows = _RasterRows()
         self.compression = False
         self.page_counter = 1
         self.two_color_printing = False
         self.cut_at_end = False
         self.high_resolution_printing = False
         self.filename_fmt = self.DEFAULT_FILENAME_FMT
+        # Instruction name -> handler method, built once. analyse()
+        # dispatches through this dict instead of re-testing every
+        # opcode name against each instruction.
+        self._dispatch = {
+            'init':              self._handle_init,
+            'compression':       self._handle_compression,
+            'zero raster':       self._handle_zero_raster,
+            'raster QL':         self._handle_raster,
+            'raster P-touch':    self._handle_raster,
+            '2-color raster QL': self._handle_raster_two_color,
+            'expanded':          self._handle_expanded,
+            'media/quality':     self._handle_media_quality,
+            'print':             self._handle_print,
+        }
 
     def analyse(self):
-        instructions = self.brother_file.read()
-        for instruction in chunker(instructions):
-            for opcode in OPCODES.keys():
-                if instruction.startswith(opcode):
-                    opcode_def = OPCODES[opcode]
-                    if opcode_def[0] == 'init':
-                        self.mwidth, self.mheight = None, None
-                        self.raster_no = None
-                        self.black_rows = []
-                        self.red_rows = []
-                    payload = instruction[len(opcode):]
-                    logger.info(" {} ({}) --> found! (payload: {})".format(opcode_def[0], hex_format(opcode), hex_format(payload)))
-                    if opcode_def[0] == 'compression':
-                        self.compression = payload[0] == 0x02
-                    if opcode_def[0] == 'zero raster':
-                        self.black_rows.append(bytes())
-                        if self.two_color_printing:
-                            self.red_rows.append(bytes())
-                    if opcode_def[0] in ('raster QL', '2-color raster QL', 'raster P-touch'):
-                        rpl = bytes(payload[2:]) # raster payload
-                        if self.compression:
-                            row = bytes()
-                            index = 0
-                            while True:
-                                num = rpl[index]
-                                if num & 0x80:
-                                    num = num - 0x100
-                                if num < 0:
-                                    num = -num + 1
-                                    row += bytes([rpl[index+1]] * num)
-                                    index += 2
-                                else:
-                                    num = num + 1
-                                    row += rpl[index+1:index+1+num]
-                                    index += 1 + num
-                                if index >= len(rpl): break
-                        else:
-                            row = rpl
-                        if opcode_def[0] in ('raster QL', 'raster P-touch'):
-                            self.black_rows.append(row)
-                        else: # 2-color
-                            if   payload[0] == 0x01:
-                                self.black_rows.append(row)
-                            elif payload[0] == 0x02:
-                                self.red_rows.append(row)
-                            else:
-                                raise NotImplementedError("color: 0x%x" % payload[0])
-                    if opcode_def[0] == 'expanded':
-                        self.two_color_printing = bool(payload[0] & (1 << 0))
-                        self.cut_at_end = bool(payload[0] & (1 << 3))
-                        self.high_resolution_printing = bool(payload[0] & (1 << 6))
-                    if opcode_def[0] == 'media/quality':
-                        self.raster_no = struct.unpack('<L', payload[4:8])[0]
-                        self.mwidth = instruction[len(opcode) + 2]
-                        self.mlength = instruction[len(opcode) + 3]*256
-                        fmt = " media width: {} mm, media length: {} mm, raster no: {} rows"
-                        logger.info(fmt.format(self.mwidth, self.mlength, self.raster_no))
-                    if opcode_def[0] == 'print':
-                        logger.info("Len of black rows: %d", len(self.black_rows))
-                        logger.info("Len of red   rows: %d", len(self.red_rows))
-                        def get_im(rows):
-                            if not len(rows): return None
-                            width_dots  = max(len(row) for row in rows)
-                            height_dots = len(rows)
-                            size = (width_dots*8, height_dots)
-                            expanded_rows = []
-                            for row in rows:
-                                if len(row) == 0:
-                                    expanded_rows.append(b'\x00'*width_dots)
-                                else:
-                                    expanded_rows.append(row)
-                            data = bytes(b''.join(expanded_rows))
-                            data = bytes([2**8 + ~byte for byte in data]) # invert b/w
-                            im = Image.frombytes("1", size, data, decoder_name='raw')
-                            return im
-                        if not self.two_color_printing:
-                            im_black = get_im(self.black_rows)
-                            im = im_black
-                        else:
-                            im_black, im_red = (get_im(rows) for rows in (self.black_rows, self.red_rows))
-                            im_black = im_black.convert("RGBA")
-                            im_red = im_red.convert("L")
-                            im_red = colorize(im_red, (255, 0, 0), (255, 255, 255))
-                            im_red = im_red.convert("RGBA")
-                            pixdata_black = im_black.load()
-                            width, height = im_black.size
-                            for y in range(height):
-                                for x in range(width):
-                                    # replace "white" with "transparent"
-                                    if pixdata_black[x, y] == (255, 255, 255, 255):
-                                        pixdata_black[x, y] = (255, 255, 255, 0)
-                            im_red.paste(im_black, (0, 0), im_black)
-                            im = im_red
-                        im = im.transpose(Image.FLIP_LEFT_RIGHT)
-                        img_name = self.filename_fmt.format(counter=self.page_counter)
-                        im.save(img_name)
-                        print('Page saved as {}'.format(img_name))
-                        self.page_counter += 1
+        for instruction in chunker_stream(self.brother_file):
+            opcode = match_opcode(instruction)
+            opcode_name = OPCODE_NAME[opcode]
+            payload = instruction[len(opcode):]
+            logger.info(" {} ({}) --> found! (payload: {})".format(opcode_name, hex_format(opcode), hex_format(payload)))
+            handler = self._dispatch.get(opcode_name)
+            if handler:
+                handler(payload)
+
+    def _handle_init(self, payload):
+        self.mwidth, self.mheight = None, None
+        self.raster_no = None
+        self.black_rows = _RasterRows()
+        self.red_rows = _RasterRows()
+
+    def _handle_compression(self, payload):
+        self.compression = payload[0] == 0x02
+
+    def _handle_zero_raster(self, payload):
+        self.black_rows.append(bytes())
+        if self.two_color_printing:
+            self.red_rows.append(bytes())
+
+    def _decode_raster_payload(self, payload):
+        rpl = bytes(payload[2:]) # raster payload
+        if self.compression:
+            return _packbits_decode(rpl)
+        return rpl
+
+    def _handle_raster(self, payload):
+        self.black_rows.append(self._decode_raster_payload(payload))
+
+    def _handle_raster_two_color(self, payload):
+        row = self._decode_raster_payload(payload)
+        if   payload[0] == 0x01:
+            self.black_rows.append(row)
+        elif payload[0] == 0x02:
+            self.red_rows.append(row)
+        else:
+            raise NotImplementedError("color: 0x%x" % payload[0])
+
+    def _handle_expanded(self, payload):
+        self.two_color_printing = bool(payload[0] & (1 << 0))
+        self.cut_at_end = bool(payload[0] & (1 << 3))
+        self.high_resolution_printing = bool(payload[0] & (1 << 6))
+
+    def _handle_media_quality(self, payload):
+        self.raster_no = _LE_U32(payload, 4)[0]
+        self.mwidth = payload[2]
+        self.mlength = payload[3]*256
+        fmt = " media width: {} mm, media length: {} mm, raster no: {} rows"
+        logger.info(fmt.format(self.mwidth, self.mlength, self.raster_no))
+
+    def _handle_print(self, payload):
+        logger.info("Len of black rows: %d", len(self.black_rows))
+        logger.info("Len of red   rows: %d", len(self.red_rows))
+        def get_im(rows):
+            if not len(rows): return None
+            # Invert b/w and mirror each row in one vectorized pass;
+            # printers send rows right-to-left, so this replaces the
+            # FLIP_LEFT_RIGHT transpose of the finished page.
+            buf = np.frombuffer(rows.tobytes(), dtype=np.uint8).reshape(len(rows), rows.row_length)
+            bits = np.unpackbits(buf, axis=1)
+            data = np.packbits(1 - bits[:, ::-1], axis=1).tobytes()
+            im = Image.frombytes("1", (rows.row_length*8, len(rows)), data, decoder_name='raw')
+            return im
+        if not self.two_color_printing:
+            im_black = get_im(self.black_rows)
+            im = im_black
+        else:
+            im_black, im_red = (get_im(rows) for rows in (self.black_rows, self.red_rows))
+            # In mode "1" a False pixel is a printed dot.
+            # Compose both layers in one pass: white
+            # background, red dots, black dots on top.
+            black = np.asarray(im_black, dtype=bool)
+            red = np.asarray(im_red, dtype=bool)
+            out = np.full(black.shape + (3,), 255, dtype=np.uint8)
+            out[~red] = (255, 0, 0)
+            out[~black] = (0, 0, 0)
+            im = Image.fromarray(out, "RGB")
+        img_name = self.filename_fmt.format(counter=self.page_counter)
+        im.save(img_name)
+        print('Page saved as {}'.format(img_name))
+        self.page_counter += 1
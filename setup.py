@@ -37,10 +37,12 @@ setup(name='brother_ql',
       include_package_data = False,
       zip_safe = True,
       platforms = 'any',
+      python_requires = '>=3.10',
       install_requires = [
           "click",
           "packbits",
           "pillow>=10.0.0",
+          "numpy",
           "pyusb",
           'attrs',
           'typing;python_version<"3.5"',